@@ -5,14 +5,143 @@ A program to look up and display any Bible verse from the Bible.
 Uses the Bible API to fetch verses dynamically.
 """
 
+import dbm
+import functools
+import os
+import pickle
+import shelve
 import sys
 import re
-import requests
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote, urlencode
+
+# Use orjson for parsing API responses when it is installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Bible API configuration
 BIBLE_API_BASE = "https://bible-api.com"
 DEFAULT_TRANSLATION = "kjv"  # King James Version
 
+# Disk cache for verses fetched in previous runs
+VERSE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "bible-cli")
+VERSE_CACHE_FILE = os.path.join(VERSE_CACHE_DIR, "verses.db")
+VERSE_CACHE_MAX_AGE = 30 * 24 * 60 * 60  # Revalidate after 30 days
+_VERSE_CACHE_FIELDS = frozenset({'verse', 'validators', 'fetched_at'})
+_VERSE_CACHE_LOCK = threading.Lock()
+
+# Maximum number of references fetched concurrently in one lookup
+MAX_CONCURRENT_FETCHES = 4
+
+# Error results returned by _request_verse (copied with the reference added)
+_TIMEOUT_ERROR = {
+    'error': 'Request timed out. The Bible API may be busy, please try again.',
+}
+_NETWORK_ERROR = {
+    'error': (
+        'Network error: Unable to fetch verse. '
+        'Please check your internet connection.'
+    ),
+}
+_INVALID_RESPONSE_ERROR = {
+    'error': (
+        'Invalid response from Bible API. '
+        'The verse reference may be invalid.'
+    ),
+}
+_NO_TEXT_ERROR = {
+    'error': 'No verse text found for the given reference.',
+}
+
+# Shared HTTP session, created on first use by get_session()
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+# Special commands recognized in interactive and command-line mode
+_QUIT_COMMANDS = frozenset({'quit', 'exit', 'q'})
+_HELP_COMMANDS = frozenset({'help', 'h', 'list'})
+_CLI_HELP_COMMANDS = frozenset({'help', '--help', '-h', 'list'})
+
+# Common book name abbreviations mapped to full book names
+_ABBREVIATIONS = {
+    'gen': 'Genesis', 'exo': 'Exodus', 'lev': 'Leviticus', 'num': 'Numbers', 'deu': 'Deuteronomy',
+    'jos': 'Joshua', 'jdg': 'Judges', 'rut': 'Ruth', '1sa': '1 Samuel', '2sa': '2 Samuel',
+    '1ki': '1 Kings', '2ki': '2 Kings', '1ch': '1 Chronicles', '2ch': '2 Chronicles',
+    'ezr': 'Ezra', 'neh': 'Nehemiah', 'est': 'Esther', 'job': 'Job', 'psa': 'Psalms',
+    'pro': 'Proverbs', 'ecc': 'Ecclesiastes', 'sng': 'Song of Solomon', 'isa': 'Isaiah',
+    'jer': 'Jeremiah', 'lam': 'Lamentations', 'ezk': 'Ezekiel', 'dan': 'Daniel',
+    'hos': 'Hosea', 'jol': 'Joel', 'amo': 'Amos', 'oba': 'Obadiah', 'jon': 'Jonah',
+    'mic': 'Micah', 'nam': 'Nahum', 'hab': 'Habakkuk', 'zep': 'Zephaniah',
+    'hag': 'Haggai', 'zec': 'Zechariah', 'mal': 'Malachi',
+    'mat': 'Matthew', 'mar': 'Mark', 'luk': 'Luke', 'joh': 'John', 'act': 'Acts',
+    'rom': 'Romans', '1co': '1 Corinthians', '2co': '2 Corinthians', 'gal': 'Galatians',
+    'eph': 'Ephesians', 'phi': 'Philippians', 'col': 'Colossians', '1th': '1 Thessalonians',
+    '2th': '2 Thessalonians', '1ti': '1 Timothy', '2ti': '2 Timothy', 'tit': 'Titus',
+    'phm': 'Philemon', 'heb': 'Hebrews', 'jam': 'James', '1pe': '1 Peter',
+    '2pe': '2 Peter', '1jo': '1 John', '2jo': '2 John', '3jo': '3 John',
+    'jud': 'Jude', 'rev': 'Revelation'
+}
+
+# First whitespace character, which ends the book name in a reference
+_WHITESPACE_RE = re.compile(r'\s')
+
+# Reference followed by a translation in parentheses, e.g. "John 3:16 (NIV)"
+_REF_TRANSLATION_RE = re.compile(r'^\s*(.*?)\s*\(\s*([^)]+?)\s*\)\s*$')
+
+# Separators between multiple references: ';' always, ',' only when it
+# starts a new book (so verse lists like "John 3:16,18" stay intact)
+_REFERENCE_SEPARATOR_RE = re.compile(r';|,(?=\s*\d?\s*[A-Za-z])')
+
+# Single-book reference with an optional translation, e.g. "1co 13:4-7 (NIV)"
+_INPUT_RE = re.compile(
+    r'^\s*(\d?\s*[A-Za-z]+)\s+(\d+(?::\d+(?:-\d+)?)?)'
+    r'\s*(?:\(\s*([A-Za-z]+)\s*\))?\s*$'
+)
+
+
+def get_session():
+    """
+    Get the HTTP session used for Bible API requests.
+    
+    The session is created on first use so that requests (and the TLS
+    stack it pulls in) is only imported when a verse is actually fetched.
+    Reusing it keeps the connection to the API alive between lookups.
+    
+    Returns:
+        requests.Session: The shared session
+    """
+    global _SESSION
+    if _SESSION is not None:
+        return _SESSION
+    
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            session.headers.update({
+                "Accept": "application/json",
+                "User-Agent": "bible-cli/1.0",
+            })
+            session.mount(BIBLE_API_BASE, HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=MAX_CONCURRENT_FETCHES,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False,
+                ),
+            ))
+            _SESSION = session
+    return _SESSION
+
 
 def normalize_reference(reference):
     """
@@ -27,38 +156,170 @@ def normalize_reference(reference):
     # Remove extra spaces and clean up
     reference = reference.strip()
     
-    # Replace common abbreviations with full book names
-    abbreviations = {
-        'gen': 'Genesis', 'exo': 'Exodus', 'lev': 'Leviticus', 'num': 'Numbers', 'deu': 'Deuteronomy',
-        'jos': 'Joshua', 'jdg': 'Judges', 'rut': 'Ruth', '1sa': '1 Samuel', '2sa': '2 Samuel',
-        '1ki': '1 Kings', '2ki': '2 Kings', '1ch': '1 Chronicles', '2ch': '2 Chronicles',
-        'ezr': 'Ezra', 'neh': 'Nehemiah', 'est': 'Esther', 'job': 'Job', 'psa': 'Psalms',
-        'pro': 'Proverbs', 'ecc': 'Ecclesiastes', 'sng': 'Song of Solomon', 'isa': 'Isaiah',
-        'jer': 'Jeremiah', 'lam': 'Lamentations', 'ezk': 'Ezekiel', 'dan': 'Daniel',
-        'hos': 'Hosea', 'jol': 'Joel', 'amo': 'Amos', 'oba': 'Obadiah', 'jon': 'Jonah',
-        'mic': 'Micah', 'nam': 'Nahum', 'hab': 'Habakkuk', 'zep': 'Zephaniah',
-        'hag': 'Haggai', 'zec': 'Zechariah', 'mal': 'Malachi',
-        'mat': 'Matthew', 'mar': 'Mark', 'luk': 'Luke', 'joh': 'John', 'act': 'Acts',
-        'rom': 'Romans', '1co': '1 Corinthians', '2co': '2 Corinthians', 'gal': 'Galatians',
-        'eph': 'Ephesians', 'phi': 'Philippians', 'col': 'Colossians', '1th': '1 Thessalonians',
-        '2th': '2 Thessalonians', '1ti': '1 Timothy', '2ti': '2 Timothy', 'tit': 'Titus',
-        'phm': 'Philemon', 'heb': 'Hebrews', 'jam': 'James', '1pe': '1 Peter',
-        '2pe': '2 Peter', '1jo': '1 John', '2jo': '2 John', '3jo': '3 John',
-        'jud': 'Jude', 'rev': 'Revelation'
+    # Replace a leading book abbreviation with the full book name,
+    # leaving the reference untouched when there is nothing to replace
+    match = _WHITESPACE_RE.search(reference)
+    if match is None:
+        return _ABBREVIATIONS.get(reference.lower(), reference)
+    
+    idx = match.start()
+    book = _ABBREVIATIONS.get(reference[:idx].lower())
+    if book is None:
+        return reference
+    
+    return f"{book} {reference[idx:].lstrip()}"
+
+
+def _load_cached_verse(key):
+    """
+    Load a previously fetched verse from the disk cache.
+    
+    Args:
+        key (str): The disk cache key
+    
+    Returns:
+        dict: The cache entry with 'verse', 'validators' and 'fetched_at'
+            keys, or None if not cached
+    """
+    try:
+        with _VERSE_CACHE_LOCK:
+            with shelve.open(VERSE_CACHE_FILE, flag='r') as shelf:
+                entry = shelf.get(key)
+    except dbm.error:
+        return None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        # A corrupt entry is treated like a missing one
+        return None
+    
+    # Entries written in an older format are also treated as missing
+    if not isinstance(entry, dict):
+        return None
+    if not _VERSE_CACHE_FIELDS <= entry.keys():
+        return None
+    return entry
+
+
+def _store_cached_verse(key, verse_data, validators):
+    """
+    Save a fetched verse to the disk cache.
+    
+    Args:
+        key (str): The disk cache key
+        verse_data (dict): The verse data to save
+        validators (dict): Conditional request headers for revalidating
+            the verse later
+    """
+    entry = {
+        'verse': verse_data,
+        'validators': validators,
+        'fetched_at': time.time(),
     }
+    try:
+        os.makedirs(VERSE_CACHE_DIR, exist_ok=True)
+        with _VERSE_CACHE_LOCK, shelve.open(VERSE_CACHE_FILE) as shelf:
+            shelf[key] = entry
+    except dbm.error:
+        # The disk cache is only an optimization; ignore write failures
+        pass
+
+
+class _UncachedResult(Exception):
+    """
+    Carries an error result out of the verse cache so it is not stored.
+    """
+
+    def __init__(self, result):
+        super().__init__(result.get('error'))
+        self.result = result
+
+
+class _VerseKey:
+    """
+    Verse cache key that ignores the casing of the reference.
+    
+    Book names are case-insensitive, so "john 3:16" and "John 3:16"
+    share a single cache entry, while the reference keeps its casing
+    for the API request.
+    """
+
+    __slots__ = ('reference', 'translation', '_key')
+
+    def __init__(self, reference, translation):
+        self.reference = reference
+        self.translation = translation
+        self._key = (reference.lower(), translation)
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __eq__(self, other):
+        return isinstance(other, _VerseKey) and self._key == other._key
+
+
+@functools.lru_cache(maxsize=1024)
+def _fetch_verse_cached(verse_key):
+    """
+    Fetch a verse, caching successful results in memory and on disk.
     
-    # Check for abbreviations and replace them
-    parts = reference.split()
-    if parts and parts[0].lower() in abbreviations:
-        parts[0] = abbreviations[parts[0].lower()]
-        reference = ' '.join(parts)
+    Args:
+        verse_key (_VerseKey): Normalized reference and lowercase
+            translation to look up
     
-    return reference
+    Returns:
+        dict: The verse data
+    
+    Raises:
+        _UncachedResult: If the lookup failed
+    """
+    normalized_ref = verse_key.reference
+    translation = verse_key.translation
+    key = f"{translation}|{normalized_ref.lower()}"
+    entry = _load_cached_verse(key)
+    if entry is None:
+        validators = None
+    elif time.time() - entry['fetched_at'] < VERSE_CACHE_MAX_AGE:
+        return entry['verse']
+    else:
+        validators = entry['validators']
+    
+    verse_data, validators = _request_verse(
+        normalized_ref, translation, validators
+    )
+    if verse_data is None:
+        # Not modified since it was cached
+        verse_data = entry['verse']
+    elif 'error' in verse_data:
+        if entry is not None:
+            # Fall back to the stale copy, e.g. when offline
+            return entry['verse']
+        raise _UncachedResult(verse_data)
+    
+    _store_cached_verse(key, verse_data, validators)
+    return verse_data
+
+
+def _fetch_normalized_verse(normalized_ref, translation):
+    """
+    Fetch a Bible verse whose reference is already normalized.
+    
+    Args:
+        normalized_ref (str): The normalized Bible verse reference
+        translation (str): Lowercase Bible translation to use
+    
+    Returns:
+        dict: The verse data or error information
+    """
+    try:
+        return dict(_fetch_verse_cached(
+            _VerseKey(normalized_ref, translation)
+        ))
+    except _UncachedResult as e:
+        return e.result
 
 
 def fetch_verse(reference, translation=DEFAULT_TRANSLATION):
     """
-    Fetch a Bible verse from the Bible API.
+    Fetch a Bible verse, using cached results when available.
     
     Args:
         reference (str): The Bible verse reference (e.g., "John 3:16", "Genesis 1:1")
@@ -67,26 +328,67 @@ def fetch_verse(reference, translation=DEFAULT_TRANSLATION):
     Returns:
         dict: The verse data or error information
     """
+    return _fetch_normalized_verse(
+        normalize_reference(reference), translation.lower()
+    )
+
+
+fetch_verse.cache_clear = _fetch_verse_cached.cache_clear
+fetch_verse.cache_info = _fetch_verse_cached.cache_info
+
+
+@functools.lru_cache(maxsize=32)
+def _translation_suffix(translation):
+    """
+    Build the API URL query string for a translation.
+    
+    Args:
+        translation (str): Lowercase Bible translation to use
+    
+    Returns:
+        str: The query string, or an empty string for KJV (the API default)
+    """
+    if translation == 'kjv':
+        return ''
+    return f"?{urlencode({'translation': translation})}"
+
+
+def _request_verse(normalized_ref, translation, validators=None):
+    """
+    Fetch a Bible verse from the Bible API.
+    
+    Args:
+        normalized_ref (str): The normalized Bible verse reference
+        translation (str): Lowercase Bible translation to use
+        validators (dict): Conditional request headers from a cached copy
+            of the verse, if any
+    
+    Returns:
+        tuple: (verse data or error information, validators). The verse
+            data is None if the API reports the cached copy is unchanged.
+    """
+    import requests
+    
     try:
-        # Normalize the reference
-        normalized_ref = normalize_reference(reference)
-        
-        # Prepare the API URL
-        # Replace spaces with + for URL encoding
-        api_reference = normalized_ref.replace(' ', '+')
-        url = f"{BIBLE_API_BASE}/{api_reference}"
-        
-        # Add translation parameter if not KJV
-        if translation.lower() != 'kjv':
-            url += f"?translation={translation}"
+        # Prepare the API URL, percent-encoding the reference
+        api_reference = quote(normalized_ref, safe=':')
+        url = (
+            f"{BIBLE_API_BASE}/{api_reference}"
+            f"{_translation_suffix(translation)}"
+        )
         
         # Make the API request
-        response = requests.get(url, timeout=10)
+        response = get_session().get(url, headers=validators, timeout=10)
+        
+        if validators and response.status_code == 304:
+            return None, validators
 
         if not response.ok:
             try:
-                error_payload = response.json()
+                error_payload = _json_loads(response.content)
             except ValueError:
+                error_payload = None
+            if not isinstance(error_payload, dict):
                 error_payload = {}
 
             message = error_payload.get(
@@ -102,44 +404,58 @@ def fetch_verse(reference, translation=DEFAULT_TRANSLATION):
             elif not message:
                 message = f"Bible API returned status code {response.status_code}."
 
-            return {"error": message, "reference": normalized_ref}
+            return {"error": message, "reference": normalized_ref}, None
 
         # Parse the JSON response
-        data = response.json()
+        data = _json_loads(response.content)
+        if not isinstance(data, dict):
+            return (
+                {**_INVALID_RESPONSE_ERROR, 'reference': normalized_ref},
+                None,
+            )
         
-        # Extract verse information
-        verse_text = data.get('text', '').strip()
-        verse_reference = data.get('reference', normalized_ref)
-        translation_name = data.get('translation_name', f'{translation.upper()}')
+        # Extract verse information, treating null fields as missing
+        verse_text = data.get('text') or ''
+        verse_reference = data.get('reference') or normalized_ref
+        translation_name = (
+            data.get('translation_name') or translation.upper()
+        )
+        if not all(
+            isinstance(value, str)
+            for value in (verse_text, verse_reference, translation_name)
+        ):
+            return (
+                {**_INVALID_RESPONSE_ERROR, 'reference': normalized_ref},
+                None,
+            )
         
+        verse_text = verse_text.strip()
         if not verse_text:
-            return {
-                'error': 'No verse text found for the given reference.',
-                'reference': normalized_ref
-            }
+            return {**_NO_TEXT_ERROR, 'reference': normalized_ref}, None
+        
+        # Remember the validators so the verse can be revalidated cheaply
+        validators = {}
+        if response.headers.get('ETag'):
+            validators['If-None-Match'] = response.headers['ETag']
+        if response.headers.get('Last-Modified'):
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
         
         return {
             'reference': verse_reference,
             'text': verse_text,
             'translation_name': translation_name,
             'translation': translation
-        }
+        }, validators
         
-    except requests.exceptions.RequestException as e:
-        return {
-            'error': f'Network error: Unable to fetch verse. Please check your internet connection.',
-            'reference': normalized_ref
-        }
-    except (ValueError, requests.exceptions.JSONDecodeError):
-        return {
-            'error': 'Invalid response from Bible API. The verse reference may be invalid.',
-            'reference': normalized_ref
-        }
-    except Exception as e:
-        return {
-            'error': f'Unexpected error: {str(e)}',
-            'reference': normalized_ref
-        }
+    except requests.exceptions.Timeout:
+        return {**_TIMEOUT_ERROR, 'reference': normalized_ref}, None
+    except requests.exceptions.RequestException:
+        return {**_NETWORK_ERROR, 'reference': normalized_ref}, None
+    except ValueError:
+        return (
+            {**_INVALID_RESPONSE_ERROR, 'reference': normalized_ref},
+            None,
+        )
 
 
 def show_help():
@@ -159,6 +475,9 @@ def show_help():
     print("\nYou can also specify a translation:")
     print("  - John 3:16 (NIV)")
     print("  - Genesis 1:1 (ESV)")
+    print("\nLook up several verses at once with ';' or ',':")
+    print("  - John 3:16; Romans 8:28")
+    print("  - Psalm 23:1, Genesis 1:1 (ESV)")
     print("\nAvailable translations include: KJV, NIV, ESV, NASB, NLT, and more!")
     print("\nSpecial commands:")
     print("  - 'list' or 'help': Show this help")
@@ -183,19 +502,16 @@ def display_verse(verse_data):
         print("Type 'help' for usage instructions.")
         return
     
-    # Display the reference
     reference = verse_data.get('reference', 'Unknown Reference')
-    print(f"\n{reference}")
-    print("=" * len(reference))
-    
-    # Display the verse text
     text = verse_data.get('text', '').strip()
-    print(f"\n{text}")
-    
-    # Display translation info
     translation = verse_data.get('translation_name', 'Unknown')
-    print(f"\n({translation})")
-    print()
+    
+    # Display the reference, verse text and translation info in one write
+    sys.stdout.write(
+        f"\n{reference}\n{'=' * len(reference)}\n"
+        f"\n{text}\n"
+        f"\n({translation})\n\n"
+    )
 
 
 def parse_reference_with_translation(input_text):
@@ -209,15 +525,85 @@ def parse_reference_with_translation(input_text):
         tuple: (reference, translation)
     """
     # Check if translation is specified in parentheses
-    if '(' in input_text and ')' in input_text:
-        parts = input_text.split('(')
-        reference = parts[0].strip()
-        translation = parts[1].rstrip(')').strip().lower()
-        return reference, translation
+    match = _REF_TRANSLATION_RE.match(input_text)
+    if match:
+        return match.group(1), match.group(2).lower()
     
     return input_text.strip(), DEFAULT_TRANSLATION
 
 
+def _parse_input(input_text):
+    """
+    Parse user input into a normalized reference and translation.
+    
+    Common single-book references are handled with one regex match and
+    one abbreviation lookup; anything else falls back to
+    parse_reference_with_translation() and normalize_reference().
+    
+    Args:
+        input_text (str): User input that may contain reference and translation
+    
+    Returns:
+        tuple: (normalized reference, translation)
+    """
+    match = _INPUT_RE.match(input_text)
+    if match:
+        book, chapter_verse, translation = match.groups()
+        book = _ABBREVIATIONS.get(book.lower(), book)
+        return (
+            f"{book} {chapter_verse}",
+            translation.lower() if translation else DEFAULT_TRANSLATION,
+        )
+    
+    reference, translation = parse_reference_with_translation(input_text)
+    return normalize_reference(reference), translation
+
+
+def lookup_references(input_text):
+    """
+    Look up one or more Bible verse references.
+    
+    Several references can be separated with ';' or ',' (e.g.,
+    "John 3:16; Romans 8:28 (NIV)") and are fetched concurrently.
+    
+    Args:
+        input_text (str): User input with one or more references, each
+            with an optional translation
+    
+    Returns:
+        list: The verse data or error information for each reference,
+            in input order, or [None] if no reference was entered
+    """
+    references = [
+        _parse_input(part)
+        for part in _REFERENCE_SEPARATOR_RE.split(input_text)
+        if part.strip()
+    ]
+    if not references:
+        # Nothing but separators was entered
+        return [None]
+    if len(references) == 1:
+        return [_fetch_normalized_verse(*references[0])]
+    
+    workers = min(MAX_CONCURRENT_FETCHES, len(references))
+    executor = ThreadPoolExecutor(max_workers=workers)
+    futures = []
+    try:
+        for ref in references:
+            futures.append(executor.submit(_fetch_normalized_verse, *ref))
+        results = [future.result() for future in futures]
+    except KeyboardInterrupt:
+        # Exit promptly instead of waiting for in-flight requests, and
+        # drop the ones that have not started yet
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=False)
+        raise
+    
+    executor.shutdown()
+    return results
+
+
 def main():
     """
     Main function to run the Bible verse lookup program.
@@ -233,12 +619,11 @@ def main():
         reference = ' '.join(sys.argv[1:])
         
         # Check for special commands
-        if reference.lower() in ['help', '--help', '-h']:
+        if reference.lower() in _CLI_HELP_COMMANDS:
             show_help()
         else:
-            ref, translation = parse_reference_with_translation(reference)
-            verse_data = fetch_verse(ref, translation)
-            display_verse(verse_data)
+            for verse_data in lookup_references(reference):
+                display_verse(verse_data)
     else:
         # Interactive mode
         print("Enter Bible verse references (e.g., 'John 3:16', 'Psalm 23:1-6')")
@@ -249,21 +634,20 @@ def main():
         while True:
             try:
                 reference = input("Enter verse reference: ").strip()
+                if not reference:
+                    continue
                 
-                if reference.lower() in ['quit', 'exit', 'q']:
+                command = reference.lower()
+                if command in _QUIT_COMMANDS:
                     print("Goodbye!")
                     break
                 
-                if reference.lower() in ['help', 'h']:
+                if command in _HELP_COMMANDS:
                     show_help()
                     continue
                 
-                if not reference:
-                    continue
-                
-                ref, translation = parse_reference_with_translation(reference)
-                verse_data = fetch_verse(ref, translation)
-                display_verse(verse_data)
+                for verse_data in lookup_references(reference):
+                    display_verse(verse_data)
                 
             except KeyboardInterrupt:
                 print("\n\nGoodbye!")
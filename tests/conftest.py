@@ -0,0 +1,147 @@
+"""
+Shared fixtures for the Bible verse lookup tests.
+"""
+
+import json
+
+import pytest
+
+import bible
+
+
+class FakeResponse:
+    """
+    Minimal stand-in for requests.Response.
+    """
+
+    def __init__(self, status_code=200, payload=None, headers=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.reason = "OK" if self.ok else "Error"
+        self.content = b"" if payload is None else json.dumps(payload).encode()
+        self.headers = headers or {}
+
+
+class FakeSession:
+    """
+    Fake HTTP session that replays queued responses and records requests.
+
+    Routed responses are returned for their URL every time; any other
+    request gets the next queued response.
+    """
+
+    def __init__(self):
+        self.responses = []
+        self.routes = {}
+        self.calls = []
+
+    def queue_error(self, failure):
+        """
+        Queue an exception to raise for the next request.
+
+        Args:
+            failure (Exception): The exception to raise
+        """
+        self.responses.append(failure)
+
+    def queue_response(self, status_code=200, payload=None, headers=None):
+        """
+        Queue a raw API response for the next request.
+
+        Args:
+            status_code (int): HTTP status code
+            payload: JSON payload, or None for an empty body
+            headers (dict): Response headers
+        """
+        self.responses.append(FakeResponse(status_code, payload, headers))
+
+    def queue_verse(self, reference="John 3:16",
+                    text="For God so loved the world", headers=None):
+        """
+        Queue a successful verse response for the next request.
+
+        Args:
+            reference (str): The verse reference in the payload
+            text (str): The verse text in the payload
+            headers (dict): Response headers
+        """
+        self.queue_response(200, _verse_payload(reference, text), headers)
+
+    def route_verse(self, url, reference, text):
+        """
+        Answer every request for a URL with a successful verse response.
+
+        Args:
+            url (str): The request URL
+            reference (str): The verse reference in the payload
+            text (str): The verse text in the payload
+        """
+        self.routes[url] = FakeResponse(200, _verse_payload(reference, text))
+
+    def get(self, url, headers=None, timeout=None):
+        """
+        Record a request and return its canned response.
+
+        Args:
+            url (str): The request URL
+            headers (dict): Request headers
+            timeout (float): Ignored
+
+        Returns:
+            FakeResponse: The routed or next queued response
+
+        Raises:
+            Exception: If the next queued item is an exception
+        """
+        self.calls.append((url, headers))
+        if url in self.routes:
+            response = self.routes[url]
+        else:
+            response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+def _verse_payload(reference, text):
+    """
+    Build a Bible API verse payload.
+
+    Args:
+        reference (str): The verse reference
+        text (str): The verse text
+
+    Returns:
+        dict: The payload
+    """
+    return {
+        "reference": reference,
+        "text": text,
+        "translation_name": "King James Version",
+    }
+
+
+@pytest.fixture(autouse=True)
+def verse_cache(tmp_path, monkeypatch):
+    """
+    Point the disk cache at a temporary directory and clear the memory
+    cache around each test.
+    """
+    cache_dir = tmp_path / "bible-cli"
+    monkeypatch.setattr(bible, "VERSE_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(
+        bible, "VERSE_CACHE_FILE", str(cache_dir / "verses.db")
+    )
+    bible.fetch_verse.cache_clear()
+    yield cache_dir
+    bible.fetch_verse.cache_clear()
+
+
+@pytest.fixture
+def session(monkeypatch):
+    """
+    Replace the shared HTTP session with a FakeSession.
+    """
+    fake = FakeSession()
+    monkeypatch.setattr(bible, "get_session", lambda: fake)
+    return fake
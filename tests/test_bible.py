@@ -0,0 +1,469 @@
+"""
+Tests for the Bible verse lookup program.
+"""
+
+import os
+import shelve
+import subprocess
+import sys
+
+import pytest
+import requests
+
+import bible
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code):
+    """
+    Run Python code in a fresh interpreter from the repository root.
+
+    Args:
+        code (str): The code to run
+
+    Returns:
+        str: The process's standard output
+    """
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True,
+    )
+    return result.stdout
+
+
+def test_fetch_verse(session):
+    session.queue_verse()
+
+    verse = bible.fetch_verse("joh 3:16")
+
+    assert verse == {
+        "reference": "John 3:16",
+        "text": "For God so loved the world",
+        "translation_name": "King James Version",
+        "translation": "kjv",
+    }
+    assert len(session.calls) == 1
+
+
+def test_fetch_verse_is_cached(session):
+    session.queue_verse()
+
+    bible.fetch_verse("John 3:16")
+    bible.fetch_verse.cache_clear()
+    verse = bible.fetch_verse("John 3:16")
+
+    assert verse["text"] == "For God so loved the world"
+    assert len(session.calls) == 1
+
+
+def test_fetch_verse_errors_are_not_cached(session):
+    session.queue_response(404, {"error": "not found"})
+    session.queue_verse()
+
+    assert bible.fetch_verse("John 3:16") == {
+        "error": "not found",
+        "reference": "John 3:16",
+    }
+    assert "error" not in bible.fetch_verse("John 3:16")
+    assert len(session.calls) == 2
+
+
+@pytest.mark.parametrize("reference, expected", [
+    ("gen 1:1", "Genesis 1:1"),
+    ("gen\t1:1", "Genesis 1:1"),
+    ("  1co  13:4-7 ", "1 Corinthians 13:4-7"),
+    ("rev", "Revelation"),
+    ("John 3:16", "John 3:16"),
+    ("1 John 1:9", "1 John 1:9"),
+])
+def test_normalize_reference(reference, expected):
+    assert bible.normalize_reference(reference) == expected
+
+
+def test_fetch_verse_cache_ignores_case(session):
+    session.queue_verse()
+
+    bible.fetch_verse("john 3:16")
+    bible.fetch_verse.cache_clear()
+    verse = bible.fetch_verse("JOHN 3:16")
+
+    assert verse["text"] == "For God so loved the world"
+    assert session.calls == [("https://bible-api.com/john%203:16", None)]
+
+
+def test_fetch_verse_keeps_reference_casing(session):
+    session.queue_response(200, {"text": "For God so loved the world"})
+
+    verse = bible.fetch_verse("joh 3:16")
+
+    assert session.calls[0][0] == "https://bible-api.com/John%203:16"
+    assert verse["reference"] == "John 3:16"
+
+
+def test_import_does_not_load_requests():
+    output = run_python(
+        "import sys, bible\n"
+        "bible.normalize_reference('gen 1:1')\n"
+        "bible.parse_reference_with_translation('John 3:16 (NIV)')\n"
+        "print('requests' in sys.modules)"
+    )
+
+    assert output.strip() == "False"
+
+
+def test_json_fallback_without_orjson():
+    output = run_python(
+        "import sys\n"
+        "sys.modules['orjson'] = None\n"
+        "import json, bible\n"
+        "print(bible._json_loads is json.loads)\n"
+        "print(bible._json_loads(b'{\"text\": \"In the beginning\"}'))"
+    )
+
+    assert output.splitlines() == ["True", "{'text': 'In the beginning'}"]
+
+
+def test_display_verse(capsys):
+    bible.display_verse({
+        "reference": "John 3:16",
+        "text": " For God so loved the world ",
+        "translation_name": "King James Version",
+    })
+
+    assert capsys.readouterr().out == (
+        "\nJohn 3:16\n"
+        "=========\n"
+        "\nFor God so loved the world\n"
+        "\n(King James Version)\n"
+        "\n"
+    )
+
+
+def test_display_verse_error(capsys):
+    bible.display_verse({"error": "not found", "reference": "Nope 1:1"})
+
+    assert capsys.readouterr().out == (
+        "\nError: not found\n"
+        "Type 'help' for usage instructions.\n"
+    )
+
+
+@pytest.mark.parametrize("input_text, expected", [
+    ("John 3:16", ("John 3:16", "kjv")),
+    ("gen 1:1 (ESV)", ("Genesis 1:1", "esv")),
+    ("1co 13:4-7 (niv)", ("1 Corinthians 13:4-7", "niv")),
+    ("Song of Solomon 2:1 (NIV)", ("Song of Solomon 2:1", "niv")),
+    ("John 3:16,18", ("John 3:16,18", "kjv")),
+])
+def test_parse_input(input_text, expected):
+    assert bible._parse_input(input_text) == expected
+
+
+def test_parsed_references_are_not_normalized_again(session, monkeypatch):
+    session.queue_verse("Genesis 1:1", "In the beginning")
+    calls = []
+    normalize_reference = bible.normalize_reference
+
+    def spy(reference):
+        calls.append(reference)
+        return normalize_reference(reference)
+
+    monkeypatch.setattr(bible, "normalize_reference", spy)
+
+    bible.lookup_references("gen 1:1")
+
+    assert calls == []
+    assert session.calls[0][0] == "https://bible-api.com/Genesis%201:1"
+
+
+@pytest.mark.parametrize("input_text, expected", [
+    ("John 3:16,18", ["John 3:16,18"]),
+    ("John 3:16; Romans 8:28", ["John 3:16", " Romans 8:28"]),
+    ("Psalm 23:1, 1 John 1:9", ["Psalm 23:1", " 1 John 1:9"]),
+])
+def test_reference_separator(input_text, expected):
+    assert bible._REFERENCE_SEPARATOR_RE.split(input_text) == expected
+
+
+def test_lookup_references(session):
+    session.route_verse(
+        "https://bible-api.com/John%203:16",
+        "John 3:16", "For God so loved the world",
+    )
+    session.route_verse(
+        "https://bible-api.com/Romans%208:28",
+        "Romans 8:28", "And we know",
+    )
+
+    verses = bible.lookup_references("John 3:16; rom 8:28")
+
+    assert [verse["reference"] for verse in verses] == [
+        "John 3:16",
+        "Romans 8:28",
+    ]
+
+
+def test_lookup_references_without_references(session):
+    verses = bible.lookup_references(" ; ; ")
+
+    assert verses == [None]
+    assert session.calls == []
+
+
+class InterruptedFuture:
+    """
+    Future whose result is interrupted by Ctrl-C.
+    """
+
+    def __init__(self):
+        self.cancelled = False
+
+    def result(self):
+        """
+        Simulate Ctrl-C while waiting for the result.
+        """
+        raise KeyboardInterrupt
+
+    def cancel(self):
+        """
+        Record that the future was cancelled.
+        """
+        self.cancelled = True
+
+
+class InterruptedExecutor:
+    """
+    Executor stand-in whose futures are all interrupted.
+    """
+
+    def __init__(self, max_workers):
+        self.futures = []
+        self.shutdown_calls = []
+
+    def submit(self, fn, *args):
+        """
+        Return an interrupted future without running the function.
+        """
+        future = InterruptedFuture()
+        self.futures.append(future)
+        return future
+
+    def shutdown(self, wait=True):
+        """
+        Record how the executor was shut down.
+        """
+        self.shutdown_calls.append(wait)
+
+
+def test_lookup_references_interrupted(monkeypatch):
+    executors = []
+
+    def make_executor(max_workers):
+        executors.append(InterruptedExecutor(max_workers))
+        return executors[-1]
+
+    monkeypatch.setattr(bible, "ThreadPoolExecutor", make_executor)
+
+    with pytest.raises(KeyboardInterrupt):
+        bible.lookup_references("John 3:16; Romans 8:28")
+
+    executor = executors[0]
+    assert executor.shutdown_calls == [False]
+    assert all(future.cancelled for future in executor.futures)
+
+
+@pytest.mark.parametrize("translation, expected", [
+    ("kjv", ""),
+    ("niv", "?translation=niv"),
+    ("oeb-us", "?translation=oeb-us"),
+    ("a b", "?translation=a+b"),
+])
+def test_translation_suffix(translation, expected):
+    assert bible._translation_suffix(translation) == expected
+
+
+def test_translation_suffix_cache_is_bounded():
+    assert bible._translation_suffix.cache_info().maxsize == 32
+
+
+@pytest.mark.parametrize("payload, message", [
+    (["not", "a", "verse"], "Invalid response"),
+    ({"text": None}, "No verse text found"),
+    ({"text": ""}, "No verse text found"),
+    ({"text": ["In the beginning"]}, "Invalid response"),
+    ({"text": "In the beginning", "reference": 1}, "Invalid response"),
+])
+def test_fetch_verse_invalid_payloads(session, payload, message):
+    session.queue_response(200, payload)
+
+    verse = bible.fetch_verse("Genesis 1:1")
+
+    assert verse["error"].startswith(message)
+    assert verse["reference"] == "Genesis 1:1"
+
+
+def test_fetch_verse_null_reference(session):
+    session.queue_response(200, {"text": "In the beginning", "reference": None})
+
+    verse = bible.fetch_verse("Genesis 1:1")
+
+    assert verse["reference"] == "Genesis 1:1"
+
+
+def test_fetch_verse_unparseable_response(session):
+    session.queue_response(200)
+
+    verse = bible.fetch_verse("Genesis 1:1")
+
+    assert verse["error"].startswith("Invalid response")
+
+
+@pytest.mark.parametrize("failure, message", [
+    (requests.exceptions.Timeout(), "Request timed out"),
+    (requests.exceptions.ConnectionError(), "Network error"),
+])
+def test_fetch_verse_network_errors(session, failure, message):
+    session.queue_error(failure)
+
+    verse = bible.fetch_verse("Genesis 1:1")
+
+    assert verse["error"].startswith(message)
+    assert verse["reference"] == "Genesis 1:1"
+
+
+@pytest.mark.parametrize("command", ["help", "--help", "-h", "LIST"])
+def test_main_command_line_help(session, monkeypatch, capsys, command):
+    monkeypatch.setattr(sys, "argv", ["bible.py", command])
+
+    bible.main()
+
+    assert "Bible Verse Lookup Help" in capsys.readouterr().out
+    assert session.calls == []
+
+
+def test_main_command_line_lookup(session, monkeypatch, capsys):
+    session.queue_verse()
+    monkeypatch.setattr(sys, "argv", ["bible.py", "John", "3:16"])
+
+    bible.main()
+
+    assert "For God so loved the world" in capsys.readouterr().out
+
+
+def feed_input(monkeypatch, lines):
+    """
+    Answer input() prompts with the given lines, then raise EOFError.
+
+    Args:
+        monkeypatch: The pytest monkeypatch fixture
+        lines (list): The lines to enter
+    """
+    answers = iter(lines)
+
+    def fake_input(prompt):
+        try:
+            return next(answers)
+        except StopIteration:
+            raise EOFError
+
+    monkeypatch.setattr(sys, "argv", ["bible.py"])
+    monkeypatch.setattr("builtins.input", fake_input)
+
+
+@pytest.mark.parametrize("command", ["help", "H", "list"])
+def test_main_interactive_help(session, monkeypatch, capsys, command):
+    feed_input(monkeypatch, ["", command, "quit"])
+
+    bible.main()
+
+    output = capsys.readouterr().out
+    assert "Bible Verse Lookup Help" in output
+    assert output.endswith("Goodbye!\n")
+    assert session.calls == []
+
+
+@pytest.mark.parametrize("command", ["quit", "EXIT", "q"])
+def test_main_interactive_quit(session, monkeypatch, capsys, command):
+    feed_input(monkeypatch, [command, "John 3:16"])
+
+    bible.main()
+
+    assert capsys.readouterr().out.endswith("Goodbye!\n")
+    assert session.calls == []
+
+
+def test_main_interactive_lookup(session, monkeypatch, capsys):
+    session.queue_verse()
+    feed_input(monkeypatch, ["John 3:16"])
+
+    bible.main()
+
+    output = capsys.readouterr().out
+    assert "For God so loved the world" in output
+    assert output.endswith("\nGoodbye!\n")
+
+
+def test_fresh_verse_is_not_revalidated(session):
+    session.queue_verse(headers={"ETag": '"v1"'})
+
+    bible.fetch_verse("John 3:16")
+    bible.fetch_verse.cache_clear()
+    bible.fetch_verse("John 3:16")
+
+    assert len(session.calls) == 1
+
+
+def test_stale_verse_is_revalidated(session, monkeypatch):
+    session.queue_verse(headers={"ETag": '"v1"', "Last-Modified": "Mon"})
+    session.queue_response(304)
+
+    bible.fetch_verse("John 3:16")
+    bible.fetch_verse.cache_clear()
+    monkeypatch.setattr(bible, "VERSE_CACHE_MAX_AGE", 0)
+    verse = bible.fetch_verse("John 3:16")
+
+    assert verse["text"] == "For God so loved the world"
+    assert session.calls[1] == ("https://bible-api.com/John%203:16", {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon",
+    })
+
+
+def test_stale_verse_is_served_when_offline(session, monkeypatch):
+    session.queue_verse()
+    session.queue_error(requests.exceptions.ConnectionError())
+
+    bible.fetch_verse("John 3:16")
+    bible.fetch_verse.cache_clear()
+    monkeypatch.setattr(bible, "VERSE_CACHE_MAX_AGE", 0)
+    verse = bible.fetch_verse("John 3:16")
+
+    assert verse["text"] == "For God so loved the world"
+    assert len(session.calls) == 2
+
+
+@pytest.mark.parametrize("entry", [
+    {"reference": "Romans 9:9", "text": "Old"},
+    "not an entry",
+])
+def test_old_cache_entries_are_ignored(session, verse_cache, entry):
+    verse_cache.mkdir()
+    with shelve.open(bible.VERSE_CACHE_FILE) as shelf:
+        shelf["kjv|romans 9:9"] = entry
+    session.queue_verse("Romans 9:9", "For this is the word")
+
+    verse = bible.fetch_verse("rom 9:9")
+
+    assert verse["text"] == "For this is the word"
+
+
+def test_corrupt_cache_entries_are_ignored(session, verse_cache):
+    verse_cache.mkdir()
+    with shelve.open(bible.VERSE_CACHE_FILE) as shelf:
+        shelf.dict[b"kjv|romans 9:9"] = b"not a pickle"
+    session.queue_verse("Romans 9:9", "For this is the word")
+
+    verse = bible.fetch_verse("rom 9:9")
+
+    assert verse["text"] == "For this is the word"